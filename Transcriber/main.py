@@ -19,9 +19,15 @@ Version: 1.1
 import tkinter as tk
 from tkinter import ttk, filedialog
 import os
+import re
 import json
-import whisper
-import whisper_timestamped
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
+import threading
+import queue
+from types import SimpleNamespace
+import ctranslate2
+from faster_whisper import WhisperModel, BatchedInferencePipeline, decode_audio
 from pathlib import Path
 import pyperclip
 from tkinter import IntVar, StringVar, BooleanVar
@@ -29,7 +35,69 @@ from tkinter import IntVar, StringVar, BooleanVar
 # Constants
 MODELS = ["tiny", "base", "small", "medium"]
 LANGUAGES = ["English", "Dutch", "German", "Slovak"]
+LANGUAGE_CODES = {"English": "en", "Dutch": "nl", "German": "de", "Slovak": "sk"}
 SETTINGS_FILE = "transcriber_settings.json"
+BATCH_SIZE = 16
+MAX_PARALLEL_FILES = 4
+VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+CUDA_AVAILABLE = ctranslate2.get_cuda_device_count() > 0
+MODEL_CACHE_DIR = Path(__file__).parent / "model_cache"
+_PAREN_RE = re.compile(r"(.*?)\((\d+)\)$")
+
+# Keep downloaded weights next to the app so they survive between runs
+os.environ.setdefault("HF_HOME", str(MODEL_CACHE_DIR))
+
+def _segment_to_dict(segment):
+    return {
+        "start": segment.start,
+        "end": segment.end,
+        "text": segment.text,
+        "words": [
+            {"start": w.start, "end": w.end, "word": w.word}
+            for w in (segment.words or [])
+        ],
+    }
+
+def _dict_to_segment(data):
+    words = [SimpleNamespace(**w) for w in data["words"]]
+    return SimpleNamespace(start=data["start"], end=data["end"],
+                           text=data["text"], words=words)
+
+def _transcribe_shard(model_name, gpu_id, files, language, word_timestamps, vad_filter, queue):
+    # Runs in a worker process pinned to one GPU; segments are sent back as
+    # plain dicts so the main process can write the SRT files.
+    try:
+        model = WhisperModel(
+            model_name,
+            device="cuda",
+            device_index=gpu_id,
+            compute_type="float16",
+            download_root=str(MODEL_CACHE_DIR)
+        )
+        batched = BatchedInferencePipeline(model=model)
+    except Exception as e:
+        # Report every file in the shard so the main process's per-file
+        # accounting still adds up when the model itself fails to load
+        for file in files:
+            queue.put(("error", file, str(e)))
+        return
+
+    for file in files:
+        try:
+            # Decode to a 16 kHz float32 array once; the model then works
+            # from memory instead of re-running ffmpeg per pass
+            audio = decode_audio(file)
+            segments, info = batched.transcribe(
+                audio,
+                batch_size=BATCH_SIZE,
+                language=language,
+                word_timestamps=word_timestamps,
+                vad_filter=vad_filter,
+                vad_parameters=VAD_PARAMETERS
+            )
+            queue.put(("result", file, [_segment_to_dict(s) for s in segments]))
+        except Exception as e:
+            queue.put(("error", file, str(e)))
 
 class Settings:
     def __init__(self):
@@ -43,6 +111,8 @@ class Settings:
             "sentence_level": False,
             "char_limit": 20,
             "chars_to_remove": "",
+            "device": "cpu",
+            "vad_filter": True,
         }
         self.current = self.load()
     
@@ -74,8 +144,25 @@ class TranscriberGUI:
         self.word_level_var = BooleanVar(value=self.settings.current["word_level"])
         self.sentence_level_var = BooleanVar(value=self.settings.current["sentence_level"])
         self.chars_to_remove = StringVar(value=self.settings.current["chars_to_remove"])
+        self.gpu_var = BooleanVar(
+            value=CUDA_AVAILABLE and self.settings.current.get("device", "cpu") == "cuda"
+        )
+        self.vad_var = BooleanVar(value=self.settings.current.get("vad_filter", True))
+        self._ui_queue = queue.Queue()
+        self._transcribing = False
+        self._model_cache = {}
+        self._save_job = None
+        self._file_progress = {}
+        self._progress_lock = threading.Lock()
+
+        # Rebuild the deletion table only when the entry changes, so
+        # clean_text is a single translate() pass per word
+        self._translation_table = {}
+        self.chars_to_remove.trace_add('write', self._rebuild_translation_table)
+        self._rebuild_translation_table()
         
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def setup_ui(self):
         main_frame = ttk.Frame(self.root, padding="20")
@@ -97,6 +184,12 @@ class TranscriberGUI:
             ttk.Label(frame, text=label, width=15).pack(side="left")
             ttk.Combobox(frame, textvariable=var, values=values, width=30).pack(side="left")
 
+        gpu_check = ttk.Checkbutton(model_frame, text="Use GPU (CUDA)",
+                        variable=self.gpu_var)
+        gpu_check.pack(anchor="w", pady=2)
+        if not CUDA_AVAILABLE:
+            gpu_check.configure(state='disabled')
+
         # Text Settings
         text_frame = ttk.LabelFrame(main_frame, text="Text Settings", padding="10")
         text_frame.pack(fill="x", pady=5)
@@ -106,9 +199,11 @@ class TranscriberGUI:
         mode_frame.pack(fill="x")
         ttk.Checkbutton(mode_frame, text="Sentence-level", 
                         variable=self.sentence_level_var).pack(side="left", padx=5)
-        ttk.Checkbutton(mode_frame, text="Word-level", 
-                        variable=self.word_level_var, 
+        ttk.Checkbutton(mode_frame, text="Word-level",
+                        variable=self.word_level_var,
                         command=self.toggle_char_limit).pack(side="left", padx=5)
+        ttk.Checkbutton(mode_frame, text="Skip silence",
+                        variable=self.vad_var).pack(side="left", padx=5)
 
         # Characters to remove
         chars_frame = ttk.Frame(text_frame)
@@ -219,10 +314,30 @@ class TranscriberGUI:
             "word_level": self.word_level_var.get(),
             "sentence_level": self.sentence_level_var.get(),
             "char_limit": self.char_limit.get(),
-            "chars_to_remove": chars_to_remove  # Save empty string if it's placeholder
+            "chars_to_remove": chars_to_remove,  # Save empty string if it's placeholder
+            "device": "cuda" if self.gpu_var.get() else "cpu",
+            "vad_filter": self.vad_var.get()
         })
+        self._schedule_save()
+
+    def _schedule_save(self):
+        # Debounce the disk write so rapid dialog interactions don't stall
+        # the UI on repeated json.dump calls
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(500, self._flush_settings)
+
+    def _flush_settings(self):
+        self._save_job = None
         self.settings.save()
 
+    def _on_close(self):
+        # Don't let a pending debounced save die with the window
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._flush_settings()
+        self.root.destroy()
+
     def select_files(self):
         initial_dir = self.settings.current["input_directory"]
         self.files = filedialog.askopenfilenames(
@@ -255,131 +370,301 @@ class TranscriberGUI:
         if not (self.word_level_var.get() or self.sentence_level_var.get()):
             self.error_var.set("Please select at least one transcription mode")
             return
+        if self._transcribing:
+            return
 
-        try:
-            # Load models
-            if self.word_level_var.get():
-                word_model = whisper_timestamped.load_model(self.model_var.get(), device="cpu")
-            if self.sentence_level_var.get():
-                sentence_model = whisper.load_model(self.model_var.get())
-
-            total_files = len(self.files)
-            
-            for i, file in enumerate(self.files):
-                base_filename = os.path.basename(file).rsplit(".", 1)[0]
-                
-                # Word-level transcription
-                if self.word_level_var.get():
-                    result = whisper_timestamped.transcribe(
-                        word_model, 
-                        file,
-                        language=self.language_var.get().lower()
-                    )
-                    word_srt_path = self.get_unique_filename(
-                        os.path.join(self.output_dir, f"{base_filename}_cropped.srt")
-                    )
-                    self.create_word_srt(result, word_srt_path)
+        # Snapshot every setting the worker needs while still on the main
+        # thread - the checkboxes stay live during a run, and reading Tk
+        # variables from the worker would pick up mid-run changes
+        job = SimpleNamespace(
+            files=list(self.files),
+            output_dir=self.output_dir,
+            model=self.model_var.get(),
+            language=LANGUAGE_CODES.get(self.language_var.get()),
+            word_level=self.word_level_var.get(),
+            sentence_level=self.sentence_level_var.get(),
+            char_limit=self.char_limit.get(),
+            vad_filter=self.vad_var.get(),
+            use_gpu=self.gpu_var.get() and CUDA_AVAILABLE,
+            translation_table=self._translation_table,
+        )
 
-                # Sentence-level transcription
-                if self.sentence_level_var.get():
-                    result = sentence_model.transcribe(
-                        file,
-                        language=self.language_var.get().lower()
-                    )
-                    sent_srt_path = self.get_unique_filename(
-                        os.path.join(self.output_dir, f"{base_filename}_full.srt")
-                    )
-                    self.create_sentence_srt(result, sent_srt_path)
+        # Run the heavy lifting off the Tk main thread; the worker reports
+        # back through a queue drained by root.after so the UI stays live.
+        self._transcribing = True
+        self.error_var.set("")
+        self.progress['value'] = 0
+        threading.Thread(target=self._run_transcription, args=(job,), daemon=True).start()
+        self.root.after(100, self._drain_queue)
+
+    def _run_transcription(self, job):
+        try:
+            device = "cuda" if job.use_gpu else "cpu"
+            compute_type = "float16" if device == "cuda" else "int8"
 
-                self.progress['value'] = ((i + 1) / total_files) * 100
-                self.root.update()
+            # With several GPUs, shard the files across one process per device
+            if device == "cuda" and ctranslate2.get_cuda_device_count() > 1:
+                errors = self.transcribe_multi_gpu(job)
+            else:
+                errors = self.transcribe_single_device(job, device, compute_type)
 
-            self.error_var.set("Transcription completed!")
+            if not errors:
+                self._ui_queue.put(("status", "Transcription completed!"))
 
         except Exception as e:
-            self.error_var.set(str(e))
-
-    def create_word_srt(self, result, output_file):
-        current_text = ""
-        current_start = None
-        subtitle_count = 1
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            for segment in result['segments']:
-                for word in segment['words']:
-                    cleaned_word = self.clean_text(word['text'])
-                    if not cleaned_word.strip():
-                        continue
-                        
-                    if current_start is None:
-                        current_start = word['start']
-
-                    if len(current_text + cleaned_word) > self.char_limit.get():
-                        end_time = word['start']
-                        f.write(f"{subtitle_count}\n")
-                        f.write(f"{self.format_timestamp(current_start)} --> {self.format_timestamp(end_time)}\n")
-                        f.write(f"{current_text.strip()}\n\n")
-
-                        subtitle_count += 1
-                        current_text = cleaned_word + " "
-                        current_start = word['start']
-                    else:
-                        current_text += cleaned_word + " "
-
-            if current_text:
-                f.write(f"{subtitle_count}\n")
-                f.write(f"{self.format_timestamp(current_start)} --> {self.format_timestamp(segment['end'])}\n")
-                f.write(f"{current_text.strip()}\n")
-
-    def create_sentence_srt(self, result, output_file):
-        subtitle_count = 1
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            for segment in result['segments']:
-                start_time = segment['start']
-                end_time = segment['end']
-                cleaned_text = self.clean_text(segment['text']).strip()
-                
-                if not cleaned_text:
+            self._ui_queue.put(("error", str(e)))
+        finally:
+            self._ui_queue.put(("done", None))
+
+    def _drain_queue(self):
+        while True:
+            try:
+                kind, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.progress.configure(value=payload)
+            elif kind in ("status", "error"):
+                self.error_var.set(payload)
+            elif kind == "done":
+                self._transcribing = False
+
+        if self._transcribing:
+            self.root.after(100, self._drain_queue)
+
+    def get_model(self, model_name, device, compute_type):
+        # Weights are hundreds of MB; keep loaded models around so a second
+        # run with the same settings skips the load entirely
+        key = (model_name, device, compute_type)
+        if key not in self._model_cache:
+            model = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=os.cpu_count(),
+                download_root=str(MODEL_CACHE_DIR)
+            )
+            # Batched pipeline amortizes the encoder pass across segments
+            self._model_cache[key] = BatchedInferencePipeline(model=model)
+        return self._model_cache[key]
+
+    def transcribe_single_device(self, job, device, compute_type):
+        batched = self.get_model(job.model, device, compute_type)
+
+        total_files = len(job.files)
+        self._file_progress = {file: 0.0 for file in job.files}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_FILES, total_files)) as executor:
+            futures = [
+                executor.submit(self.transcribe_file, batched, job, file)
+                for file in job.files
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        return 0
+
+    def transcribe_multi_gpu(self, job):
+        gpu_ids = list(range(ctranslate2.get_cuda_device_count()))
+        shards = {gpu_id: [] for gpu_id in gpu_ids}
+        for i, file in enumerate(job.files):
+            shards[gpu_ids[i % len(gpu_ids)]].append(file)
+        shards = {gpu_id: files for gpu_id, files in shards.items() if files}
+
+        mp_queue = multiprocessing.Manager().Queue()
+        total_files = len(job.files)
+        errors = 0
+
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(
+                    _transcribe_shard,
+                    job.model,
+                    gpu_id,
+                    files,
+                    job.language,
+                    job.word_level,
+                    job.vad_filter,
+                    mp_queue
+                )
+                for gpu_id, files in shards.items()
+            ]
+
+            done = 0
+            while done < total_files:
+                try:
+                    kind, file, payload = mp_queue.get(timeout=1)
+                except queue.Empty:
+                    # A worker that dies outright never reports its files;
+                    # check the futures so that surfaces instead of hanging
+                    if all(future.done() for future in futures):
+                        for future in futures:
+                            if future.exception() is not None:
+                                errors += 1
+                                self._ui_queue.put(("error", str(future.exception())))
+                        if done < total_files and not errors:
+                            errors += 1
+                            self._ui_queue.put(("error", "Transcription worker exited unexpectedly"))
+                        break
                     continue
-                    
-                f.write(f"{subtitle_count}\n")
-                f.write(f"{self.format_timestamp(start_time)} --> {self.format_timestamp(end_time)}\n")
-                f.write(f"{cleaned_text}\n\n")
-                
-                subtitle_count += 1
 
-    def format_timestamp(self, seconds):
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds - int(seconds)) * 1000)
+                done += 1
+                if kind == "result":
+                    self.write_srt_files(job, file, [_dict_to_segment(s) for s in payload])
+                else:
+                    errors += 1
+                    self._ui_queue.put(("error", f"{os.path.basename(file)}: {payload}"))
+                self._ui_queue.put(("progress", (done / total_files) * 100))
+
+        return errors
+
+    def transcribe_file(self, batched, job, file):
+        # Decode to a 16 kHz float32 array once; the model then works from
+        # memory instead of re-running ffmpeg per pass
+        audio = decode_audio(file)
+        segments, info = batched.transcribe(
+            audio,
+            batch_size=BATCH_SIZE,
+            language=job.language,
+            word_timestamps=job.word_level,
+            vad_filter=job.vad_filter,
+            vad_parameters=VAD_PARAMETERS
+        )
+        # segments is a generator: the writer consumes it as the decoder
+        # produces it, so output and progress stream instead of waiting for
+        # the whole file
+        self.write_srt_files(job, file, segments, duration=info.duration)
+        self._report_progress(file, 1.0)
+
+    def _report_progress(self, file, fraction):
+        with self._progress_lock:
+            self._file_progress[file] = fraction
+            pct = sum(self._file_progress.values()) / len(self._file_progress) * 100
+        self._ui_queue.put(("progress", pct))
+
+    def write_srt_files(self, job, file, segments, duration=None):
+        base_filename = os.path.basename(file).rsplit(".", 1)[0]
+
+        # Accumulate subtitle blocks in memory and write each file once,
+        # instead of four small write() calls per subtitle
+        word_parts = [] if job.word_level else None
+        sent_parts = [] if job.sentence_level else None
+
+        # Word-packing state lives in locals, not on self, because the
+        # thread pool can write several files at once
+        word_state = (1, [], 0, None)
+        sent_count = 1
+        last_end = 0
+
+        for segment in segments:
+            if sent_parts is not None:
+                cleaned_text = segment.text.translate(job.translation_table).strip()
+                if cleaned_text:
+                    sent_parts.append(
+                        f"{sent_count}\n"
+                        f"{self.format_timestamp(segment.start)} --> {self.format_timestamp(segment.end)}\n"
+                        f"{cleaned_text}\n\n"
+                    )
+                    sent_count += 1
+
+            if word_parts is not None:
+                word_state = self._flush_words(job, segment.words, word_parts, word_state)
+
+            last_end = segment.end
+            if duration:
+                self._report_progress(file, min(segment.end / duration, 1.0))
+
+        if word_parts is not None:
+            subtitle_count, current_words, current_len, current_start = word_state
+            if current_words:
+                word_parts.append(
+                    f"{subtitle_count}\n"
+                    f"{self.format_timestamp(current_start)} --> {self.format_timestamp(last_end)}\n"
+                    f"{' '.join(current_words)}\n"
+                )
+            word_srt_path = self.get_unique_filename(
+                os.path.join(job.output_dir, f"{base_filename}_cropped.srt")
+            )
+            Path(word_srt_path).write_text(''.join(word_parts), encoding="utf-8")
+
+        if sent_parts is not None:
+            sent_srt_path = self.get_unique_filename(
+                os.path.join(job.output_dir, f"{base_filename}_full.srt")
+            )
+            Path(sent_srt_path).write_text(''.join(sent_parts), encoding="utf-8")
+
+    def _flush_words(self, job, words, parts, state):
+        # Track the pending line as a word list plus a running length so the
+        # limit check never re-concatenates the buffer
+        subtitle_count, current_words, current_len, current_start = state
+
+        # Hoist lookups out of the loop; the limit and deletion table come
+        # from the job snapshot, never from live Tk state
+        limit = job.char_limit
+        table = job.translation_table
+        fmt = self.format_timestamp
+        append = parts.append
+
+        for word in words:
+            # faster-whisper words carry a leading space; strip before packing
+            cleaned_word = word.word.translate(table).strip()
+            if not cleaned_word:
+                continue
+
+            if current_start is None:
+                current_start = word.start
+
+            if current_len + len(cleaned_word) > limit:
+                end_time = word.start
+                append(
+                    f"{subtitle_count}\n"
+                    f"{fmt(current_start)} --> {fmt(end_time)}\n"
+                    f"{' '.join(current_words)}\n\n"
+                )
+
+                subtitle_count += 1
+                current_words = [cleaned_word]
+                current_len = len(cleaned_word) + 1
+                current_start = word.start
+            else:
+                current_words.append(cleaned_word)
+                current_len += len(cleaned_word) + 1
+
+        return subtitle_count, current_words, current_len, current_start
+
+    @staticmethod
+    def format_timestamp(seconds):
+        # Integer divmod chain - called once or twice per subtitle, so avoid
+        # the repeated float // and % of the old version
+        millis = int(seconds * 1000)
+        hours, millis = divmod(millis, 3_600_000)
+        minutes, millis = divmod(millis, 60_000)
+        secs, millis = divmod(millis, 1000)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
     def get_unique_filename(self, filepath):
-        path = Path(filepath)
-        stem = path.stem
-        
-        import re
-        match = re.match(r"(.*?)\((\d+)\)$", stem)
-        
+        # Plain string handling - Path objects allocate and normalize on
+        # every join, which is wasted work in the counter loop
+        dirname, base = os.path.split(filepath)
+        stem, ext = os.path.splitext(base)
+
+        match = _PAREN_RE.match(stem)
         if match:
             base_name = match.group(1)
-            counter = int(match.group(2))
-            stem = f"{base_name}({counter + 1})"
+            counter = int(match.group(2)) + 1
         else:
-            stem = f"{stem}(1)"
-        
-        new_path = path.parent / f"{stem}{path.suffix}"
-        
-        while new_path.exists():
-            match = re.match(r"(.*?)\((\d+)\)$", stem)
-            base_name = match.group(1)
-            counter = int(match.group(2))
-            stem = f"{base_name}({counter + 1})"
-            new_path = path.parent / f"{stem}{path.suffix}"
-        
-        return str(new_path)
+            base_name = stem
+            counter = 1
+
+        # One directory listing instead of a stat() per candidate name
+        existing = {entry.name for entry in os.scandir(dirname)}
+
+        name = f"{base_name}({counter}){ext}"
+        while name in existing:
+            counter += 1
+            name = f"{base_name}({counter}){ext}"
+
+        return os.path.join(dirname, name)
 
     def run(self):
         # Set initial size and position
@@ -393,11 +678,16 @@ class TranscriberGUI:
         
         self.root.mainloop()
 
+    def _rebuild_translation_table(self, *args):
+        # The entry's placeholder writes into the variable too - without
+        # this guard its letters would be stripped from every transcript
+        value = self.chars_to_remove.get()
+        if value == self.PLACEHOLDER_TEXT:
+            value = ''
+        self._translation_table = str.maketrans('', '', ''.join(value.split()))
+
     def clean_text(self, text):
-        chars = self.chars_to_remove.get().split()
-        for char in chars:
-            text = text.replace(char, '')
-        return text
+        return text.translate(self._translation_table)
 
 if __name__ == "__main__":
     app = TranscriberGUI()